@@ -1,8 +1,16 @@
+import os
 from flask import Flask, request, render_template
-from src.transpiler import transpile
+from src.transpiler import build_parsers, transpile
 
 app = Flask(__name__)
 
+def init_parsers(app):
+    # Hand the lexers/parsers built at import to every request, so requests
+    # only pay for parsing
+    app.config['PARSERS'] = build_parsers()
+
+init_parsers(app)
+
 @app.route('/', methods=['GET', 'POST'])
 def index():
     output = ""
@@ -12,10 +20,11 @@ def index():
         source_lang = request.form['source_lang']
         target_lang = request.form['target_lang']
         try:
-            output = transpile(code, source_lang, target_lang)
+            output = transpile(code, source_lang, target_lang, app.config['PARSERS'])
         except Exception as e:
             error = str(e)
     return render_template('index.html', output=output, error=error)
 
 if __name__ == '__main__':
-    app.run(debug=True)
\ No newline at end of file
+    # Debug mode (reloader + debugger) is opt-in, e.g. FLASK_DEBUG=1 python app.py
+    app.run(debug=os.environ.get('FLASK_DEBUG') == '1')
\ No newline at end of file
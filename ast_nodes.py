@@ -0,0 +1,56 @@
+from dataclasses import dataclass, field
+from typing import Any
+
+# --- AST Nodes ---
+# One slotted dataclass per node kind, shared by the parsers, the semantic
+# analysis and the code generators. Slots keep each node to a fixed set of
+# fields, far smaller than a dict per node, and passes dispatch on the class.
+@dataclass(slots=True)
+class Var:
+    name: str
+
+@dataclass(slots=True)
+class BinaryOp:
+    left: Any  # Name (str) or number (int) token
+    op: str
+    right: Any
+
+@dataclass(slots=True)
+class Condition:
+    left: str
+    op: str
+    right: Any
+
+@dataclass(slots=True)
+class Declaration:
+    var: str
+    value: Any  # Name (str) or number (int) token, or a BinaryOp
+    computed_value: int | None = None  # Filled in by semantic analysis
+    slot: int | None = None  # Value slot the analysis resolved the name to
+
+@dataclass(slots=True)
+class If:
+    condition: Condition
+    body: list
+
+@dataclass(slots=True)
+class Main:
+    body: list
+
+@dataclass(slots=True)
+class Printf:
+    format: str
+    value: Var
+
+@dataclass(slots=True)
+class Print:
+    value: Var
+
+@dataclass(slots=True)
+class Include:
+    value: str
+
+@dataclass(slots=True)
+class Program:
+    body: list
+    directives: list = field(default_factory=list)
@@ -0,0 +1,130 @@
+import sys
+from src import ast_nodes
+
+# --- C Lexer ---
+class CLexerConfig:
+    # Rules follow the ply.lex conventions fastlex.ScannerLexer supports (see there)
+    # Keywords are matched by t_ID and retagged, so they need no rules of their own
+    reserved = {'int': 'INT', 'if': 'IF', 'printf': 'PRINTF', 'main': 'MAIN'}
+    tokens = ('ID', 'NUMBER', 'EQUALS', 'LESS', 'SEMI', 'LBRACE', 'RBRACE', 'LPAREN', 'RPAREN', 'PLUS', 'MINUS', 'INCLUDE', 'STRING', 'COMMA', 'HEADER') + tuple(reserved.values())
+
+    t_LBRACE = r'\{'
+    t_RBRACE = r'\}'
+    t_EQUALS = r'='
+    t_LESS = r'<'
+    t_SEMI = r';'
+    t_LPAREN = r'\('
+    t_RPAREN = r'\)'
+    t_PLUS = r'\+'
+    t_MINUS = r'-'
+    t_COMMA = r','
+    t_ignore = ' \t'
+
+    # Function rules are tried in definition order, so the most frequent come first
+    def t_ID(self, t):
+        r'[a-zA-Z_][a-zA-Z0-9_]*'
+        t.type = self.reserved.get(t.value, 'ID')
+        t.value = sys.intern(t.value)  # Names are used as dict keys throughout analysis
+        return t
+
+    def t_NUMBER(self, t):
+        r'\d+'
+        t.value = int(t.value)  # Converted once here rather than in semantic analysis
+        return t
+
+    def t_newline(self, t):
+        r'\n+'
+        t.lexer.lineno += len(t.value)
+
+    def t_INCLUDE(self, t):
+        r'\#include'
+        return t
+
+    def t_HEADER(self, t):
+        r'<\w+\.\w+>'
+        return t
+
+    def t_STRING(self, t):
+        r'"[^"]*"'
+        t.value = t.value[1:-1].replace('\\n', '')  # Remove quotes and \n
+        return t
+
+    def t_error(self, t):
+        print(f"Illegal character: {t.value[0]}")
+        t.lexer.skip(1)
+
+# --- C Parser ---
+class CParserConfig:
+    def __init__(self):
+        self.tokens = CLexerConfig.tokens
+        self.precedence = (
+            ('left', 'LESS'),
+            ('left', 'PLUS', 'MINUS'),
+            ('left', 'EQUALS'),
+        )
+
+    def p_program(self, p):
+        '''program : directives statements'''
+        p[0] = ast_nodes.Program(body=p[2], directives=p[1])
+
+    def p_directives(self, p):
+        '''directives : directive
+                      | directives directive
+                      | '''
+        if len(p) == 2:
+            p[0] = [p[1]]
+        elif len(p) == 3:
+            p[1].append(p[2])
+            p[0] = p[1]
+        else:
+            p[0] = []
+
+    def p_directive(self, p):
+        '''directive : INCLUDE HEADER'''
+        p[0] = ast_nodes.Include(value=f"{p[1]}{p[2]}")
+
+    def p_statements(self, p):
+        '''statements : statement
+                      | statements statement
+                      | '''
+        if len(p) == 2:
+            p[0] = [p[1]]
+        elif len(p) == 3:
+            p[1].append(p[2])  # Extend in place; p[1] + [p[2]] copies the list per statement
+            p[0] = p[1]
+        else:
+            p[0] = []
+
+    def p_statement_declaration(self, p):
+        '''statement : INT ID EQUALS expression SEMI'''
+        p[0] = ast_nodes.Declaration(var=p[2], value=p[4])
+
+    def p_expression(self, p):
+        '''expression : NUMBER
+                      | ID
+                      | ID PLUS ID
+                      | ID PLUS NUMBER
+                      | ID MINUS ID
+                      | ID MINUS NUMBER'''
+        if len(p) == 2:
+            p[0] = p[1]
+        else:
+            p[0] = ast_nodes.BinaryOp(left=p[1], op=p[2], right=p[3])
+
+    def p_statement_if(self, p):
+        '''statement : IF LPAREN ID LESS NUMBER RPAREN LBRACE statements RBRACE'''
+        p[0] = ast_nodes.If(condition=ast_nodes.Condition(left=p[3], op=p[4], right=p[5]), body=p[8])
+
+    def p_statement_main(self, p):
+        '''statement : INT MAIN LPAREN RPAREN LBRACE statements RBRACE'''
+        p[0] = ast_nodes.Main(body=p[6])
+
+    def p_statement_printf(self, p):
+        '''statement : PRINTF LPAREN STRING COMMA ID RPAREN SEMI'''
+        p[0] = ast_nodes.Printf(format=p[3], value=ast_nodes.Var(name=p[5]))
+
+    def p_error(self, p):
+        if p:
+            raise Exception(f"Syntax error at '{p.value}' on line {p.lineno}")
+        else:
+            raise Exception("Syntax error: Unexpected end of input")
@@ -0,0 +1,48 @@
+
+# c_parsetab.py
+# This file is automatically generated. Do not edit.
+# pylint: disable=W,C,R
+_tabversion = '3.10'
+
+_lr_method = 'LALR'
+
+_lr_signature = 'leftLESSleftPLUSMINUSleftEQUALSCOMMA EQUALS HEADER ID IF INCLUDE INT LBRACE LESS LPAREN MAIN MINUS NUMBER PLUS PRINTF RBRACE RPAREN SEMI STRINGprogram : directives statementsdirectives : directive\n                      | directives directive\n                      | directive : INCLUDE HEADERstatements : statement\n                      | statements statement\n                      | statement : INT ID EQUALS expression SEMIexpression : NUMBER\n                      | ID\n                      | ID PLUS ID\n                      | ID PLUS NUMBER\n                      | ID MINUS ID\n                      | ID MINUS NUMBERstatement : IF LPAREN ID LESS NUMBER RPAREN LBRACE statements RBRACEstatement : INT MAIN LPAREN RPAREN LBRACE statements RBRACEstatement : PRINTF LPAREN STRING COMMA ID RPAREN SEMI'
+    
+_lr_action_items = {'INCLUDE':([0,2,3,6,11,],[4,4,-2,-3,-5,]),'INT':([0,2,3,5,6,7,11,12,29,30,37,40,41,42,43,44,],[-4,8,-2,8,-3,-6,-5,-7,-9,8,8,-17,8,-18,8,-16,]),'IF':([0,2,3,5,6,7,11,12,29,30,37,40,41,42,43,44,],[-4,9,-2,9,-3,-6,-5,-7,-9,9,9,-17,9,-18,9,-16,]),'PRINTF':([0,2,3,5,6,7,11,12,29,30,37,40,41,42,43,44,],[-4,10,-2,10,-3,-6,-5,-7,-9,10,10,-17,10,-18,10,-16,]),'$end':([0,1,2,3,5,6,7,11,12,29,40,42,44,],[-4,0,-8,-2,-1,-3,-6,-5,-7,-9,-17,-18,-16,]),'HEADER':([4,],[11,]),'RBRACE':([7,12,29,30,37,40,41,42,43,44,],[-6,-7,-9,-8,40,-17,-8,-18,44,-16,]),'ID':([8,15,17,26,27,28,],[13,19,21,32,33,35,]),'MAIN':([8,],[14,]),'LPAREN':([9,10,14,],[15,16,18,]),'EQUALS':([13,],[17,]),'STRING':([16,],[20,]),'NUMBER':([17,25,27,28,],[23,31,34,36,]),'RPAREN':([18,31,32,],[24,38,39,]),'LESS':([19,],[25,]),'COMMA':([20,],[26,]),'SEMI':([21,22,23,33,34,35,36,39,],[-11,29,-10,-12,-13,-14,-15,42,]),'PLUS':([21,],[27,]),'MINUS':([21,],[28,]),'LBRACE':([24,38,],[30,41,]),}
+
+_lr_action = {}
+for _k, _v in _lr_action_items.items():
+   for _x,_y in zip(_v[0],_v[1]):
+      if not _x in _lr_action:  _lr_action[_x] = {}
+      _lr_action[_x][_k] = _y
+del _lr_action_items
+
+_lr_goto_items = {'program':([0,],[1,]),'directives':([0,],[2,]),'directive':([0,2,],[3,6,]),'statements':([2,30,41,],[5,37,43,]),'statement':([2,5,30,37,41,43,],[7,12,7,12,7,12,]),'expression':([17,],[22,]),}
+
+_lr_goto = {}
+for _k, _v in _lr_goto_items.items():
+   for _x, _y in zip(_v[0], _v[1]):
+       if not _x in _lr_goto: _lr_goto[_x] = {}
+       _lr_goto[_x][_k] = _y
+del _lr_goto_items
+_lr_productions = [
+  ("S' -> program","S'",1,None,None,None),
+  ('program -> directives statements','program',2,'p_program','c_parser.py',67),
+  ('directives -> directive','directives',1,'p_directives','c_parser.py',71),
+  ('directives -> directives directive','directives',2,'p_directives','c_parser.py',72),
+  ('directives -> <empty>','directives',0,'p_directives','c_parser.py',73),
+  ('directive -> INCLUDE HEADER','directive',2,'p_directive','c_parser.py',83),
+  ('statements -> statement','statements',1,'p_statements','c_parser.py',87),
+  ('statements -> statements statement','statements',2,'p_statements','c_parser.py',88),
+  ('statements -> <empty>','statements',0,'p_statements','c_parser.py',89),
+  ('statement -> INT ID EQUALS expression SEMI','statement',5,'p_statement_declaration','c_parser.py',99),
+  ('expression -> NUMBER','expression',1,'p_expression','c_parser.py',103),
+  ('expression -> ID','expression',1,'p_expression','c_parser.py',104),
+  ('expression -> ID PLUS ID','expression',3,'p_expression','c_parser.py',105),
+  ('expression -> ID PLUS NUMBER','expression',3,'p_expression','c_parser.py',106),
+  ('expression -> ID MINUS ID','expression',3,'p_expression','c_parser.py',107),
+  ('expression -> ID MINUS NUMBER','expression',3,'p_expression','c_parser.py',108),
+  ('statement -> IF LPAREN ID LESS NUMBER RPAREN LBRACE statements RBRACE','statement',9,'p_statement_if','c_parser.py',115),
+  ('statement -> INT MAIN LPAREN RPAREN LBRACE statements RBRACE','statement',7,'p_statement_main','c_parser.py',119),
+  ('statement -> PRINTF LPAREN STRING COMMA ID RPAREN SEMI','statement',7,'p_statement_printf','c_parser.py',123),
+]
@@ -0,0 +1,101 @@
+import re
+from ply.lex import LexToken
+
+# --- Scanner Lexer ---
+# A yacc-compatible replacement for lex.lex(): all token rules of a lexer config
+# are compiled into one master pattern, and finditer() walks the whole input in
+# C, yielding one match per token. A trailing catch-all group flags illegal
+# characters, so the scan never has to stop and restart on bad input.
+# Function rules (t_ID, t_STRING, t_newline, ...) still run on their matches,
+# so the config classes remain the single definition of each language's tokens.
+# Only plain token rules, t_ignore and t_error are supported; configs using any
+# other ply.lex feature (lexer states, literals, t_eof, t_ignore_* rules) are
+# rejected rather than silently scanned differently.
+_UNSUPPORTED = ('states', 'literals', 't_eof')
+_ERROR = object()
+
+class ScannerLexer:
+    def __init__(self, config):
+        self.config = config
+        # Ignored characters are consumed as a prefix of each match rather than
+        # as matches of their own; lex compiles rules verbose too
+        ignore = f"[{re.escape(config.t_ignore)}]" if getattr(config, 't_ignore', '') else ""
+        # The catch-all must not take an ignored character, or trailing ignored
+        # input would backtrack into it and be reported as illegal
+        error = f"(?!{ignore})(?s:.)" if ignore else "(?s:.)"
+        rules = self._collect_rules(config) + [(error, _ERROR)]
+        alternatives = "|".join(f"({regex})" for regex, _ in rules)
+        self.master = re.compile(f"{ignore}*(?:{alternatives})" if ignore else alternatives, re.VERBOSE)
+        self.rules = {}  # Master pattern group number -> rule
+        group = 1
+        for regex, rule in rules:
+            self.rules[group] = rule
+            group += re.compile(regex, re.VERBOSE).groups + 1
+        self.lineno = 1
+        self.input("")
+
+    @staticmethod
+    def _collect_rules(config):
+        # Same order as lex: function rules as defined, then string rules longest first
+        for name in _UNSUPPORTED:
+            if hasattr(config, name):
+                raise ValueError(f"Unsupported lexer attribute: {name}")
+        funcs, strings = [], []
+        for name, value in vars(type(config)).items():
+            if not name.startswith('t_') or name in ('t_ignore', 't_error'):
+                continue
+            if name.startswith('t_ignore_'):
+                raise ValueError(f"Unsupported lexer rule: {name}")
+            if callable(value):
+                func = getattr(config, name)
+                funcs.append((func.__doc__, (name[2:], func)))
+            else:
+                strings.append((value, (name[2:], None)))
+        strings.sort(key=lambda rule: len(rule[0]), reverse=True)
+        return funcs + strings
+
+    def clone(self):
+        lexer = object.__new__(ScannerLexer)
+        lexer.__dict__.update(self.__dict__)
+        return lexer
+
+    def input(self, data):
+        self.lexdata = data
+        self.lexpos = 0
+        self._matches = None
+
+    def skip(self, n):
+        self.lexpos += n
+        self._matches = None
+
+    def token(self):
+        rules = self.rules
+        while True:
+            if self._matches is None:
+                self._matches = self.master.finditer(self.lexdata, self.lexpos)
+            for m in self._matches:
+                group = m.lastindex
+                rule = rules[group]
+                tok = LexToken()
+                tok.value = m.group(group)
+                tok.lineno = self.lineno
+                tok.lexpos = m.start(group)
+                tok.lexer = self
+                if rule is _ERROR:
+                    tok.type = 'error'
+                    tok.value = self.lexdata[tok.lexpos:]
+                    self.lexpos = tok.lexpos
+                    self.config.t_error(tok)
+                    if self.lexpos == tok.lexpos:
+                        raise Exception(f"Illegal character: {tok.value[0]}")
+                    break  # Resume scanning wherever t_error skipped to
+                self.lexpos = m.end()
+                tok.type, func = rule
+                if func is not None:
+                    tok = func(tok)
+                    if tok is None:  # e.g. t_newline
+                        continue
+                return tok
+            else:
+                self.lexpos = len(self.lexdata)
+                return None
@@ -1,13 +1,14 @@
-import ply.lex as lex
-import ply.yacc as yacc
+import sys
+from src import ast_nodes
 
 # --- JS Lexer ---
 class JSLexerConfig:
-    tokens = ('VAR', 'IF', 'CONSOLE', 'DOT', 'LOG', 'ID', 'NUMBER', 'EQUALS', 'LESS', 'SEMI', 'LPAREN', 'RPAREN', 'PLUS', 'LBRACE', 'RBRACE')
+    # Rules follow the ply.lex conventions fastlex.ScannerLexer supports (see there)
+    # Keywords are matched by t_ID and retagged, so they need no rules of their own
+    reserved = {'var': 'VAR', 'if': 'IF', 'console': 'CONSOLE', 'log': 'LOG'}
+    tokens = ('DOT', 'ID', 'NUMBER', 'EQUALS', 'LESS', 'SEMI', 'LPAREN', 'RPAREN', 'PLUS', 'LBRACE', 'RBRACE') + tuple(reserved.values())
 
     # Token definitions
-    t_ID = r'[a-zA-Z_][a-zA-Z0-9_]*'
-    t_NUMBER = r'\d+'
     t_EQUALS = r'='
     t_LESS = r'<'
     t_SEMI = r';'
@@ -16,35 +17,24 @@ class JSLexerConfig:
     t_PLUS = r'\+'
     t_LBRACE = r'\{'
     t_RBRACE = r'\}'
+    t_DOT = r'\.'
     t_ignore = ' \t\n'
 
-    def t_VAR(self, t):
-        r'var'
+    def t_ID(self, t):
+        r'[a-zA-Z_][a-zA-Z0-9_]*'
+        t.type = self.reserved.get(t.value, 'ID')
+        t.value = sys.intern(t.value)  # Names are used as dict keys throughout analysis
         return t
 
-    def t_IF(self, t):
-        r'if'
-        return t
-
-    def t_CONSOLE(self, t):
-        r'console'
-        return t
-
-    def t_DOT(self, t):
-        r'\.'
-        return t
-
-    def t_LOG(self, t):
-        r'log'
+    def t_NUMBER(self, t):
+        r'\d+'
+        t.value = int(t.value)  # Converted once here rather than in semantic analysis
         return t
 
     def t_error(self, t):
         print(f"Illegal character: {t.value[0]}")
         t.lexer.skip(1)
 
-    def build(self):
-        return lex.lex(module=self)
-
 # --- JS Parser ---
 class JSParserConfig:
     def __init__(self):
@@ -57,17 +47,23 @@ class JSParserConfig:
 
     def p_program(self, p):
         '''program : statements'''
-        p[0] = {"type": "Program", "body": p[1]}
+        p[0] = ast_nodes.Program(body=p[1])
 
     def p_statements(self, p):
         '''statements : statement
                       | statements statement
                       | '''
-        p[0] = [p[1]] if len(p) == 2 else p[1] + [p[2]] if len(p) == 3 else []
+        if len(p) == 2:
+            p[0] = [p[1]]
+        elif len(p) == 3:
+            p[1].append(p[2])  # Extend in place; p[1] + [p[2]] copies the list per statement
+            p[0] = p[1]
+        else:
+            p[0] = []
 
     def p_statement_declaration(self, p):
         '''statement : VAR ID EQUALS expression SEMI'''
-        p[0] = {"type": "Declaration", "var": p[2], "value": p[4]}
+        p[0] = ast_nodes.Declaration(var=p[2], value=p[4])
 
     def p_expression(self, p):
         '''expression : NUMBER
@@ -77,19 +73,19 @@ class JSParserConfig:
         if len(p) == 2:
             p[0] = p[1]
         else:
-            p[0] = {"left": p[1], "op": p[2], "right": p[3]}
+            p[0] = ast_nodes.BinaryOp(left=p[1], op=p[2], right=p[3])
 
     def p_statement_if(self, p):
         '''statement : IF LPAREN ID LESS NUMBER RPAREN statement
                      | IF LPAREN ID LESS NUMBER RPAREN LBRACE statements RBRACE'''
         if len(p) == 8:
-            p[0] = {"type": "If", "condition": {"left": p[3], "op": p[4], "right": p[5]}, "body": [p[7]]}
+            p[0] = ast_nodes.If(condition=ast_nodes.Condition(left=p[3], op=p[4], right=p[5]), body=[p[7]])
         else:
-            p[0] = {"type": "If", "condition": {"left": p[3], "op": p[4], "right": p[5]}, "body": p[8]}
+            p[0] = ast_nodes.If(condition=ast_nodes.Condition(left=p[3], op=p[4], right=p[5]), body=p[8])
 
     def p_statement_print(self, p):
         '''statement : CONSOLE DOT LOG LPAREN ID RPAREN SEMI'''
-        p[0] = {"type": "Print", "value": {"type": "Var", "name": p[5]}}
+        p[0] = ast_nodes.Print(value=ast_nodes.Var(name=p[5]))
 
     def p_error(self, p):
         if p:
@@ -0,0 +1,42 @@
+
+# js_parsetab.py
+# This file is automatically generated. Do not edit.
+# pylint: disable=W,C,R
+_tabversion = '3.10'
+
+_lr_method = 'LALR'
+
+_lr_signature = 'leftLESSleftPLUSleftDOTCONSOLE DOT EQUALS ID IF LBRACE LESS LOG LPAREN NUMBER PLUS RBRACE RPAREN SEMI VARprogram : statementsstatements : statement\n                      | statements statement\n                      | statement : VAR ID EQUALS expression SEMIexpression : NUMBER\n                      | ID\n                      | ID PLUS ID\n                      | ID PLUS NUMBERstatement : IF LPAREN ID LESS NUMBER RPAREN statement\n                     | IF LPAREN ID LESS NUMBER RPAREN LBRACE statements RBRACEstatement : CONSOLE DOT LOG LPAREN ID RPAREN SEMI'
+    
+_lr_action_items = {'VAR':([0,2,3,7,20,25,27,28,29,30,31,],[4,4,-2,-3,-5,4,-10,4,-12,4,-11,]),'IF':([0,2,3,7,20,25,27,28,29,30,31,],[5,5,-2,-3,-5,5,-10,5,-12,5,-11,]),'CONSOLE':([0,2,3,7,20,25,27,28,29,30,31,],[6,6,-2,-3,-5,6,-10,6,-12,6,-11,]),'$end':([0,1,2,3,7,20,27,29,31,],[-4,0,-1,-2,-3,-5,-10,-12,-11,]),'RBRACE':([3,7,20,27,28,29,30,31,],[-2,-3,-5,-10,-4,-12,31,-11,]),'ID':([4,9,11,18,19,],[8,12,14,22,23,]),'LPAREN':([5,13,],[9,18,]),'DOT':([6,],[10,]),'EQUALS':([8,],[11,]),'LOG':([10,],[13,]),'NUMBER':([11,17,19,],[16,21,24,]),'LESS':([12,],[17,]),'SEMI':([14,15,16,23,24,26,],[-7,20,-6,-8,-9,29,]),'PLUS':([14,],[19,]),'RPAREN':([21,22,],[25,26,]),'LBRACE':([25,],[28,]),}
+
+_lr_action = {}
+for _k, _v in _lr_action_items.items():
+   for _x,_y in zip(_v[0],_v[1]):
+      if not _x in _lr_action:  _lr_action[_x] = {}
+      _lr_action[_x][_k] = _y
+del _lr_action_items
+
+_lr_goto_items = {'program':([0,],[1,]),'statements':([0,28,],[2,30,]),'statement':([0,2,25,28,30,],[3,7,27,3,7,]),'expression':([11,],[15,]),}
+
+_lr_goto = {}
+for _k, _v in _lr_goto_items.items():
+   for _x, _y in zip(_v[0], _v[1]):
+       if not _x in _lr_goto: _lr_goto[_x] = {}
+       _lr_goto[_x][_k] = _y
+del _lr_goto_items
+_lr_productions = [
+  ("S' -> program","S'",1,None,None,None),
+  ('program -> statements','program',1,'p_program','js_parser.py',49),
+  ('statements -> statement','statements',1,'p_statements','js_parser.py',53),
+  ('statements -> statements statement','statements',2,'p_statements','js_parser.py',54),
+  ('statements -> <empty>','statements',0,'p_statements','js_parser.py',55),
+  ('statement -> VAR ID EQUALS expression SEMI','statement',5,'p_statement_declaration','js_parser.py',65),
+  ('expression -> NUMBER','expression',1,'p_expression','js_parser.py',69),
+  ('expression -> ID','expression',1,'p_expression','js_parser.py',70),
+  ('expression -> ID PLUS ID','expression',3,'p_expression','js_parser.py',71),
+  ('expression -> ID PLUS NUMBER','expression',3,'p_expression','js_parser.py',72),
+  ('statement -> IF LPAREN ID LESS NUMBER RPAREN statement','statement',7,'p_statement_if','js_parser.py',79),
+  ('statement -> IF LPAREN ID LESS NUMBER RPAREN LBRACE statements RBRACE','statement',9,'p_statement_if','js_parser.py',80),
+  ('statement -> CONSOLE DOT LOG LPAREN ID RPAREN SEMI','statement',7,'p_statement_print','js_parser.py',87),
+]
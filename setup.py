@@ -0,0 +1,9 @@
+import os
+from setuptools import setup
+from Cython.Build import cythonize
+
+# Only builds the optional compiled code generators, from any directory:
+#   python src/setup.py build_ext --inplace
+# Paths resolve against this directory, so the module lands next to codegen.py.
+os.chdir(os.path.dirname(os.path.abspath(__file__)))
+setup(ext_modules=cythonize("codegen.py", language_level=3))
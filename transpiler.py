@@ -1,270 +1,214 @@
-import ply.lex as lex
+import functools
+import hashlib
+import logging
+import os
+import pickle
+import tempfile
+from collections import ChainMap
 import ply.yacc as yacc
+from src import ast_nodes
+from src.c_parser import CLexerConfig, CParserConfig
+from src.codegen import python_codegen, typescript_codegen
+from src.fastlex import ScannerLexer
 from src.js_parser import JSLexerConfig, JSParserConfig
 
-# --- C Lexer ---
-class CLexerConfig:
-    tokens = ('INT', 'IF', 'PRINTF', 'ID', 'NUMBER', 'EQUALS', 'LESS', 'SEMI', 'LBRACE', 'RBRACE', 'LPAREN', 'RPAREN', 'PLUS', 'MINUS', 'INCLUDE', 'STRING', 'COMMA', 'HEADER', 'MAIN')
+logger = logging.getLogger(__name__)
 
-    t_ID = r'[a-zA-Z_][a-zA-Z0-9_]*'
-    t_NUMBER = r'\d+'
-    t_EQUALS = r'='
-    t_LESS = r'<'
-    t_SEMI = r';'
-    t_LPAREN = r'\('
-    t_RPAREN = r'\)'
-    t_PLUS = r'\+'
-    t_MINUS = r'-'
-    t_COMMA = r','
-    t_ignore = ' \t'
-
-    def t_newline(self, t):
-        r'\n+'
-        t.lexer.lineno += len(t.value)
-
-    def t_INCLUDE(self, t):
-        r'\#include'
-        return t
-
-    def t_HEADER(self, t):
-        r'<\w+\.\w+>'
-        return t
-
-    def t_STRING(self, t):
-        r'"[^"]*"'
-        t.value = t.value[1:-1].replace('\\n', '')  # Remove quotes and \n
-        return t
-
-    def t_INT(self, t):
-        r'int'
-        return t
-
-    def t_IF(self, t):
-        r'if'
-        return t
-
-    def t_PRINTF(self, t):
-        r'printf'
-        return t
-
-    def t_MAIN(self, t):
-        r'main'
-        return t
-
-    def t_LBRACE(self, t):
-        r'\{'
-        return t
-
-    def t_RBRACE(self, t):
-        r'\}'
-        return t
-
-    def t_error(self, t):
-        print(f"Illegal character: {t.value[0]}")
-        t.lexer.skip(1)
-
-    def build(self):
-        return lex.lex(module=self)
-
-# --- C Parser ---
-class CParserConfig:
-    def __init__(self):
-        self.tokens = CLexerConfig.tokens
-        self.precedence = (
-            ('left', 'LESS'),
-            ('left', 'PLUS', 'MINUS'),
-            ('left', 'EQUALS'),
-        )
-
-    def p_program(self, p):
-        '''program : directives statements'''
-        p[0] = {"type": "Program", "directives": p[1], "body": p[2]}
-
-    def p_directives(self, p):
-        '''directives : directive
-                      | directives directive
-                      | '''
-        if len(p) == 2:
-            p[0] = [p[1]]
-        elif len(p) == 3:
-            p[0] = p[1] + [p[2]]
+# --- Semantic Analysis ---
+# Declarations are lowered to a flat program of integer ops, one value slot per
+# op: CONST loads the immediate in lhs, ADD/SUB combine the slots lhs and rhs.
+_OP_CONST, _OP_ADD, _OP_SUB = 0, 1, 2
+
+def _eval_ops(ops, lhs, rhs):
+    # Plain Python ints, so values never overflow the way fixed-width ones would
+    vals = [0] * len(ops)
+    for i in range(len(ops)):
+        if ops[i] == _OP_CONST:
+            vals[i] = lhs[i]
+        elif ops[i] == _OP_ADD:
+            vals[i] = vals[lhs[i]] + vals[rhs[i]]
         else:
-            p[0] = []
-
-    def p_directive(self, p):
-        '''directive : INCLUDE HEADER'''
-        p[0] = {"type": "Include", "value": f"{p[1]}{p[2]}"}
-
-    def p_statements(self, p):
-        '''statements : statement
-                      | statements statement
-                      | '''
-        p[0] = [p[1]] if len(p) == 2 else p[1] + [p[2]] if len(p) == 3 else []
-
-    def p_statement_declaration(self, p):
-        '''statement : INT ID EQUALS expression SEMI'''
-        p[0] = {"type": "Declaration", "var": p[2], "value": p[4]}
-
-    def p_expression(self, p):
-        '''expression : NUMBER
-                      | ID
-                      | ID PLUS ID
-                      | ID PLUS NUMBER
-                      | ID MINUS ID
-                      | ID MINUS NUMBER'''
-        if len(p) == 2:
-            p[0] = p[1]
+            vals[i] = vals[lhs[i]] - vals[rhs[i]]
+    return vals
+
+class _Lowering:
+    def __init__(self, block_scoped):
+        self.block_scoped = block_scoped
+        self.constants = {}  # Literal token -> value slot
+        self.ops, self.lhs, self.rhs = [], [], []
+        self.declarations = []  # Nodes whose slot gets filled in after evaluation
+
+    def emit(self, op, left, right=0):
+        self.ops.append(op)
+        self.lhs.append(left)
+        self.rhs.append(right)
+        return len(self.ops) - 1
+
+    def enter_block(self, scope):
+        # C names live until the end of their block; JS var is function-scoped
+        return scope.new_child() if self.block_scoped else scope
+
+    def resolve(self, tok, scope):
+        # Map an operand to its value slot; each distinct literal is loaded once
+        slot = scope.get(tok)
+        if slot is not None:
+            return slot
+        if tok not in self.constants:
+            if not isinstance(tok, int):  # The lexer turns number literals into ints
+                raise Exception(f"Undefined variable: {tok}")
+            self.constants[tok] = self.emit(_OP_CONST, tok)
+        return self.constants[tok]
+
+def _check_node(node, lowering, scope):
+    handler = _CHECK_DISPATCH.get(type(node))
+    if handler is not None:
+        handler(node, lowering, scope)
+
+def _check_declaration(node, lowering, scope):
+    if isinstance(node.value, ast_nodes.BinaryOp):  # Handle expressions
+        left_slot = lowering.resolve(node.value.left, scope)
+        right_slot = lowering.resolve(node.value.right, scope)
+        # Lower the expression
+        if node.value.op == "+":
+            node.slot = lowering.emit(_OP_ADD, left_slot, right_slot)
+        elif node.value.op == "-":
+            node.slot = lowering.emit(_OP_SUB, left_slot, right_slot)
         else:
-            p[0] = {"left": p[1], "op": p[2], "right": p[3]}
-
-    def p_statement_if(self, p):
-        '''statement : IF LPAREN ID LESS NUMBER RPAREN LBRACE statements RBRACE'''
-        p[0] = {"type": "If", "condition": {"left": p[3], "op": p[4], "right": p[5]}, "body": p[8]}
-
-    def p_statement_main(self, p):
-        '''statement : INT MAIN LPAREN RPAREN LBRACE statements RBRACE'''
-        p[0] = {"type": "Main", "body": p[6]}
-
-    def p_statement_printf(self, p):
-        '''statement : PRINTF LPAREN STRING COMMA ID RPAREN SEMI'''
-        p[0] = {"type": "Printf", "format": p[3], "value": {"type": "Var", "name": p[5]}}
-
-    def p_error(self, p):
-        if p:
-            raise Exception(f"Syntax error at '{p.value}' on line {p.lineno}")
-        else:
-            raise Exception("Syntax error: Unexpected end of input")
-
-# --- Semantic Analysis ---
-def semantic_analysis(ast):
-    variables = {}  # Store variable values
+            raise Exception(f"Unsupported operator: {node.value.op}")
+    else:
+        node.slot = lowering.resolve(node.value, scope)  # Simple number or variable
+    scope[node.var] = node.slot
+    lowering.declarations.append(node)
+
+def _check_if(node, lowering, scope):
+    if node.condition.left not in scope:
+        raise Exception(f"Undefined variable: {node.condition.left}")
+    body_scope = lowering.enter_block(scope)
+    for stmt in node.body:
+        _check_node(stmt, lowering, body_scope)
+
+def _check_main(node, lowering, scope):
+    body_scope = lowering.enter_block(scope)
+    for stmt in node.body:
+        _check_node(stmt, lowering, body_scope)
+
+def _check_printf(node, lowering, scope):
+    if node.value.name not in scope:
+        raise Exception(f"Undefined variable: {node.value.name}")
+
+_CHECK_DISPATCH = {
+    ast_nodes.Declaration: _check_declaration,
+    ast_nodes.If: _check_if,
+    ast_nodes.Main: _check_main,
+    ast_nodes.Printf: _check_printf,
+}
 
-    def check_node(node):
-        if node["type"] == "Declaration":
-            if isinstance(node["value"], dict):  # Handle expressions
-                left = node["value"]["left"]
-                right = node["value"]["right"]
-                # Evaluate left operand
-                if isinstance(left, str) and left.isdigit():  # Check if it's a number literal
-                    left_val = int(left)
-                else:
-                    if left not in variables:
-                        raise Exception(f"Undefined variable: {left}")
-                    left_val = variables[left]
-                # Evaluate right operand
-                if isinstance(right, str) and right.isdigit():  # Check if it's a number literal
-                    right_val = int(right)
-                else:
-                    if right not in variables:
-                        raise Exception(f"Undefined variable: {right}")
-                    right_val = variables[right]
-                # Evaluate the expression
-                if node["value"]["op"] == "+":
-                    node["computed_value"] = left_val + right_val
-                elif node["value"]["op"] == "-":
-                    node["computed_value"] = left_val - right_val
-                else:
-                    raise Exception(f"Unsupported operator: {node['value']['op']}")
-            else:
-                node["computed_value"] = int(node["value"])  # Simple number
-            variables[node["var"]] = node["computed_value"]
-        elif node["type"] == "If":
-            if node["condition"]["left"] not in variables:
-                raise Exception(f"Undefined variable: {node['condition']['left']}")
-            for stmt in node["body"]:
-                check_node(stmt)
-        elif node["type"] == "Main":
-            for stmt in node["body"]:
-                check_node(stmt)
-        elif node["type"] == "Printf":
-            if node["value"]["name"] not in variables:
-                raise Exception(f"Undefined variable: {node['value']['name']}")
+def semantic_analysis(ast, block_scoped=True):
+    lowering = _Lowering(block_scoped)
+    scope = ChainMap()  # Variable name -> value slot, one map per open block
+    for stmt in ast.body:
+        _check_node(stmt, lowering, scope)
 
-    for stmt in ast["body"]:
-        check_node(stmt)
+    vals = _eval_ops(lowering.ops, lowering.lhs, lowering.rhs)
+    for node in lowering.declarations:
+        node.computed_value = vals[node.slot]
     return ast
 
-# --- Code Generators ---
-def python_codegen(ast):
-    code = ""
-    indent = 0
-
-    def gen_indent():
-        return "    " * indent
-
-    def gen_node(node):
-        nonlocal code, indent
-        if node["type"] == "Declaration":
-            code += f"{gen_indent()}{node['var']} = {node['computed_value']}\n"
-        elif node["type"] == "If":
-            code += f"{gen_indent()}if {node['condition']['left']} {node['condition']['op']} {node['condition']['right']}:\n"
-            indent += 1
-            for stmt in node["body"]:
-                gen_node(stmt)
-            indent -= 1
-        elif node["type"] == "Main":
-            for stmt in node["body"]:
-                gen_node(stmt)
-        elif node["type"] == "Printf":
-            code += f"{gen_indent()}print({node['value']['name']})\n"
-
-    for stmt in ast["body"]:
-        gen_node(stmt)
-    return code
-
-def typescript_codegen(ast):
-    code = ""
-    indent = 0
-
-    def gen_indent():
-        return "    " * indent
-
-    def gen_node(node):
-        nonlocal code, indent
-        if node["type"] == "Declaration":
-            code += f"{gen_indent()}let {node['var']}: number = {node['computed_value']};\n"
-        elif node["type"] == "If":
-            code += f"{gen_indent()}if ({node['condition']['left']} {node['condition']['op']} {node['condition']['right']}) {{\n"
-            indent += 1
-            for stmt in node["body"]:
-                gen_node(stmt)
-            indent -= 1
-            code += f"{gen_indent()}}}\n"
-        elif node["type"] == "Main":
-            code += f"{gen_indent()}function main() {{\n"
-            indent += 1
-            for stmt in node["body"]:
-                gen_node(stmt)
-            indent -= 1
-            code += f"{gen_indent()}}}\n"
-            code += f"{gen_indent()}main();\n"
-        elif node["type"] == "Printf":
-            code += f"{gen_indent()}console.log({node['value']['name']});\n"
-
-    for stmt in ast["body"]:
-        gen_node(stmt)
-    return code
-
 codegens = {
     "python": python_codegen,
     "typescript": typescript_codegen
 }
 
+# --- Cached Lexers/Parsers ---
+# Building the lex/yacc tables is by far the most expensive step, so one
+# (lexer, parser) pair per source language is built at import; build_parsers()
+# is memoized, so every later caller gets that same set back.
+# The parse tables are shipped as *_parsetab.py; yacc checks their signature
+# on load and rebuilds (and rewrites) them whenever the grammar has changed.
+@functools.lru_cache(maxsize=None)
+def build_parsers():
+    return {
+        "c": (ScannerLexer(CLexerConfig()), yacc.yacc(module=CParserConfig(), debug=False, write_tables=True, tabmodule='c_parsetab')),
+        "js": (ScannerLexer(JSLexerConfig()), yacc.yacc(module=JSParserConfig(), debug=False, write_tables=True, tabmodule='js_parsetab')),
+    }
+
+_PARSERS = build_parsers()
+
+# --- AST Cache ---
+# Checked ASTs are cached in memory, keyed by a hash of the source. Setting
+# TRANSPILER_AST_CACHE_DIR also persists them across processes; that directory
+# keeps at most _AST_CACHE_MAX_ENTRIES files, the least recently written ones
+# are pruned. Bump the version whenever the AST layout or the analysis changes.
+_AST_CACHE_VERSION = "4"
+_AST_CACHE_DIR = os.environ.get("TRANSPILER_AST_CACHE_DIR")
+_AST_CACHE_MAX_ENTRIES = 256
+
+def _load_cached_ast(key):
+    if not _AST_CACHE_DIR:
+        return None
+    try:
+        with open(os.path.join(_AST_CACHE_DIR, f"{key}.pkl"), "rb") as f:
+            return pickle.load(f)
+    except Exception:  # Missing or unreadable entries are simply re-parsed
+        return None
+
+def _prune_ast_cache():
+    entries = []
+    with os.scandir(_AST_CACHE_DIR) as it:
+        for entry in it:
+            if entry.name.endswith(".pkl"):
+                try:
+                    entries.append((entry.stat().st_mtime, entry.path))
+                except OSError:  # Pruned concurrently by another worker
+                    pass
+    entries.sort()
+    for _, path in entries[:max(0, len(entries) - _AST_CACHE_MAX_ENTRIES)]:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+def _store_cached_ast(key, ast):
+    if not _AST_CACHE_DIR:
+        return
+    try:
+        os.makedirs(_AST_CACHE_DIR, exist_ok=True)
+        # A unique temp file per write, so concurrent threads never share one
+        fd, tmp_path = tempfile.mkstemp(dir=_AST_CACHE_DIR, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(ast, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, os.path.join(_AST_CACHE_DIR, f"{key}.pkl"))  # Never leave a half-written entry behind
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+        _prune_ast_cache()
+    except OSError:
+        pass
+
+@functools.lru_cache(maxsize=128)
+def _parse_cached(key, source_code, source_lang, base_lexer, parser):
+    checked_ast = _load_cached_ast(key)
+    if checked_ast is None:
+        lexer = base_lexer.clone()  # Lexers are stateful, parsers are not
+        lexer.input(source_code)
+        ast = parser.parse(source_code, lexer=lexer)
+        if logger.isEnabledFor(logging.DEBUG):  # Formatting a large AST is not free
+            logger.debug("AST: %r", ast)
+        checked_ast = semantic_analysis(ast, block_scoped=(source_lang == "c"))
+        _store_cached_ast(key, checked_ast)
+    return checked_ast
+
 # --- Main Function ---
-def transpile(source_code, source_lang="c", target_lang="python"):
-    if source_lang == "c":
-        lexer = CLexerConfig().build()
-        parser = yacc.yacc(module=CParserConfig(), debug=True)
-    elif source_lang == "js":
-        lexer = JSLexerConfig().build()
-        parser = yacc.yacc(module=JSParserConfig(), debug=True)
-    else:
+def transpile(source_code, source_lang="c", target_lang="python", parsers=None):
+    parsers = parsers if parsers is not None else _PARSERS
+    if source_lang not in parsers:
         raise ValueError("Unsupported source language")
+    base_lexer, parser = parsers[source_lang]
 
-    lexer.input(source_code)
-    ast = parser.parse(source_code, lexer=lexer)
-    print("AST:", ast)  # Debug line
-    checked_ast = semantic_analysis(ast)
+    digest = hashlib.sha256(source_code.encode()).hexdigest()
+    key = f"{digest}-{source_lang}-v{_AST_CACHE_VERSION}"
+    checked_ast = _parse_cached(key, source_code, source_lang, base_lexer, parser)
     return codegens[target_lang](checked_ast)
 
 # --- Test Code ---